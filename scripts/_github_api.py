@@ -0,0 +1,183 @@
+"""Shared GitHub REST helpers for the PR workflow scripts."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import http.client
+import json
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+# Markers are written on the first line of our comments, so only the head needs scanning.
+MARKER_WINDOW = 256
+
+# One keep-alive connection per API host, so GET + POST/PATCH share a TLS handshake.
+_CONNECTIONS: dict[tuple[str, str], http.client.HTTPConnection] = {}
+# Only these are safe to resend once the request was delivered and the server may have acted on it.
+_RETRYABLE_METHODS = frozenset({"GET", "PATCH"})
+# GitHub answers 301 (GET) and 307 (other methods) for renamed or transferred repositories.
+_REDIRECT_STATUSES = frozenset({301, 302, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+def loads(data: bytes) -> dict | list:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _etag_cache_dir() -> Path:
+    return Path(os.getenv("COMMIT_BLOCKER_CACHE_DIR", Path.home() / ".cache" / "commit-blocker"))
+
+
+def _cached_get(url: str) -> tuple[str | None, Path]:
+    cache_dir = _etag_cache_dir()
+    body_path = cache_dir / "bodies" / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+    try:
+        etags = loads((cache_dir / "etags.json").read_bytes())
+    except (OSError, ValueError):
+        return None, body_path
+    etag = etags.get(url)
+    return (etag if etag and body_path.exists() else None), body_path
+
+
+def _store_get(url: str, etag: str, body: bytes, body_path: Path) -> None:
+    etags_path = _etag_cache_dir() / "etags.json"
+    try:
+        try:
+            etags = loads(etags_path.read_bytes())
+        except (OSError, ValueError):
+            etags = {}
+        etags[url] = etag
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        etags_path.write_bytes(dumps(etags))
+    except OSError:
+        pass
+
+
+def _connection(scheme: str, netloc: str) -> http.client.HTTPConnection:
+    conn = _CONNECTIONS.get((scheme, netloc))
+    if conn is None:
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = urllib.request.getproxies().get(scheme)
+        host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+        if proxy and not urllib.request.proxy_bypass(host):
+            # Honour http(s)_proxy / no_proxy like urllib did: CONNECT through the proxy.
+            proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            conn = factory(proxy_parts.hostname, proxy_parts.port or 80, timeout=30)
+            tunnel_headers = {}
+            if proxy_parts.username:
+                credentials = urllib.parse.unquote(proxy_parts.username)
+                credentials += f":{urllib.parse.unquote(proxy_parts.password or '')}"
+                token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+                tunnel_headers["Proxy-Authorization"] = f"Basic {token}"
+            conn.set_tunnel(netloc, headers=tunnel_headers)
+        else:
+            conn = factory(netloc, timeout=30)
+        _CONNECTIONS[(scheme, netloc)] = conn
+    return conn
+
+
+def _send(
+    method: str,
+    url: str,
+    data: bytes | None,
+    headers: dict[str, str],
+) -> tuple[http.client.HTTPResponse, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    conn = _connection(parts.scheme, parts.netloc)
+    try:
+        try:
+            conn.request(method, target, body=data, headers=headers)
+        except (ConnectionResetError, BrokenPipeError):
+            # The idle keep-alive socket was already closed, so nothing was delivered; resend.
+            conn.close()
+            conn.request(method, target, body=data, headers=headers)
+        try:
+            resp = conn.getresponse()
+        except ConnectionResetError:  # includes http.client.RemoteDisconnected
+            if method not in _RETRYABLE_METHODS:
+                raise
+            conn.close()
+            conn.request(method, target, body=data, headers=headers)
+            resp = conn.getresponse()
+        return resp, resp.read()
+    except BaseException:
+        # Never leave a half-used connection cached; the next call reconnects cleanly.
+        conn.close()
+        raise
+
+
+def request_raw(method: str, url: str, token: str, payload: dict | None = None) -> bytes:
+    """Send a GitHub API request and return the raw response body."""
+
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "User-Agent": "commit-blocker",
+    }
+    data = None
+    if payload is not None:
+        data = dumps(payload)
+        headers["Content-Type"] = "application/json"
+
+    etag = body_path = None
+    if method == "GET":
+        etag, body_path = _cached_get(url)
+        if etag:
+            headers["If-None-Match"] = etag
+
+    target_url = url
+    for _ in range(_MAX_REDIRECTS + 1):
+        resp, raw = _send(method, target_url, data, headers)
+        location = resp.headers.get("Location")
+        if resp.status not in _REDIRECT_STATUSES or not location:
+            break
+        next_url = urllib.parse.urljoin(target_url, location)
+        if urllib.parse.urlsplit(next_url).netloc != urllib.parse.urlsplit(target_url).netloc:
+            headers.pop("Authorization", None)
+        target_url = next_url
+
+    if resp.status == 304 and body_path is not None:
+        return body_path.read_bytes()
+    if resp.status >= 300:
+        raise urllib.error.HTTPError(target_url, resp.status, resp.reason, resp.headers, None)
+    new_etag = resp.headers.get("ETag")
+
+    if body_path is not None and new_etag:
+        _store_get(url, new_etag, raw, body_path)
+    return raw
+
+
+def request(method: str, url: str, token: str, payload: dict | None = None) -> dict | list:
+    """Send a GitHub API request and return the decoded JSON body."""
+
+    return loads(request_raw(method, url, token, payload) or b"{}")
+
+
+def find_marked_comment(raw: bytes, marker_key: str) -> dict | None:
+    """Return the comment whose body starts with the `<!-- marker_key -->` marker, if any."""
+
+    # Probe the undecoded list first; JSON encoders may escape "<" and ">", so match the marker key.
+    if marker_key.encode("utf-8") not in raw:
+        return None
+    marker = f"<!-- {marker_key} -->"
+    return next((c for c in loads(raw) if marker in (c.get("body") or "")[:MARKER_WINDOW]), None)
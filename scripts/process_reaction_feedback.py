@@ -2,36 +2,22 @@
 
 from __future__ import annotations
 
-import json
 import os
-import urllib.request
-
-ASSESSMENT_MARKER = "<!-- commit-blocker:pr-ai-assessment -->"
-FEEDBACK_MARKER = "<!-- commit-blocker:reaction-feedback -->"
+from pathlib import Path
 
+from _github_api import MARKER_WINDOW, find_marked_comment, loads, request, request_raw
 
-def _request(method: str, url: str, token: str, payload: dict | None = None) -> dict | list:
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    data = None
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-
-    req = urllib.request.Request(url, method=method, headers=headers, data=data)
-    with urllib.request.urlopen(req) as resp:  # noqa: S310
-        return json.loads(resp.read().decode("utf-8") or "{}")
+ASSESSMENT_MARKER = "<!-- commit-blocker:pr-ai-assessment -->"
+FEEDBACK_MARKER_KEY = "commit-blocker:reaction-feedback"
+FEEDBACK_MARKER = f"<!-- {FEEDBACK_MARKER_KEY} -->"
 
 
 def main() -> int:
-    event = json.loads(open(os.environ["GITHUB_EVENT_PATH"], encoding="utf-8").read())
+    event = loads(Path(os.environ["GITHUB_EVENT_PATH"]).read_bytes())
     reaction = str(event.get("reaction", {}).get("content", ""))
     comment = event.get("comment", {})
 
-    if ASSESSMENT_MARKER not in str(comment.get("body", "")):
+    if ASSESSMENT_MARKER not in (comment.get("body") or "")[:MARKER_WINDOW]:
         return 0
 
     issue = event.get("issue", {})
@@ -60,17 +46,13 @@ def main() -> int:
     )
 
     comments_url = f"{api}/repos/{repo}/issues/{issue_number}/comments"
-    comments = _request("GET", comments_url, token)
-    existing = None
-    for item in comments:
-        if FEEDBACK_MARKER in str(item.get("body", "")):
-            existing = item
-            break
+    raw_comments = request_raw("GET", f"{comments_url}?per_page=100", token)
+    existing = find_marked_comment(raw_comments, FEEDBACK_MARKER_KEY)
 
     if existing:
-        _request("PATCH", f"{api}/repos/{repo}/issues/comments/{existing['id']}", token, {"body": body})
+        request("PATCH", f"{api}/repos/{repo}/issues/comments/{existing['id']}", token, {"body": body})
     else:
-        _request("POST", comments_url, token, {"body": body})
+        request("POST", comments_url, token, {"body": body})
 
     return 0
 
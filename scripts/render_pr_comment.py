@@ -2,27 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import heapq
 import os
-import urllib.request
+from pathlib import Path
 
-MARKER = "<!-- commit-blocker:pr-ai-assessment -->"
+from _github_api import find_marked_comment, loads, request, request_raw
 
-
-def _request(method: str, url: str, token: str, payload: dict | None = None) -> dict | list:
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/vnd.github+json",
-        "X-GitHub-Api-Version": "2022-11-28",
-    }
-    data = None
-    if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-
-    req = urllib.request.Request(url, method=method, headers=headers, data=data)
-    with urllib.request.urlopen(req) as resp:  # noqa: S310
-        return json.loads(resp.read().decode("utf-8") or "{}")
+MARKER_KEY = "commit-blocker:pr-ai-assessment"
+MARKER = f"<!-- {MARKER_KEY} -->"
+FIRST_ASSESSMENT_STATUS = "No feedback yet (first assessment)."
+NO_REACTION_STATUS = "No reaction received yet → treated as likely correct classification."
+NO_SIGNALS_LINE = "- No signals were produced."
 
 
 def _label(score: float) -> str:
@@ -35,14 +25,14 @@ def _label(score: float) -> str:
 
 def _feedback_status(existing_comment: dict | None) -> str:
     if not existing_comment:
-        return "No feedback yet (first assessment)."
+        return FIRST_ASSESSMENT_STATUS
 
     reactions = existing_comment.get("reactions", {})
     positive = int(reactions.get("+1", 0))
     negative = int(reactions.get("-1", 0)) + int(reactions.get("confused", 0))
 
     if positive == 0 and negative == 0:
-        return "No reaction received yet → treated as likely correct classification."
+        return NO_REACTION_STATUS
     if negative > 0:
         return (
             f"Negative feedback detected ({negative} signal(s)) → treat this as misclassification and retune thresholds/weights."
@@ -54,12 +44,12 @@ def _build_comment(scan: dict, pr_number: int, feedback_status: str) -> str:
     score = float(scan.get("score", 0.0))
     score_100 = float(scan.get("score_100", round(score * 100, 1)))
     band = str(scan.get("risk_band", _label(score)))
-    top = sorted(scan.get("signals", []), key=lambda item: float(item.get("contribution", 0.0)), reverse=True)[:3]
+    top = heapq.nlargest(3, scan.get("signals", []), key=lambda item: float(item.get("contribution", 0.0)))
 
     top_lines = "\n".join(
         f"- `{item.get('name')}` contribution={item.get('contribution')} evidence={item.get('evidence')}"
         for item in top
-    ) or "- No signals were produced."
+    ) or NO_SIGNALS_LINE
 
     return (
         f"{MARKER}\n"
@@ -78,8 +68,8 @@ def _build_comment(scan: dict, pr_number: int, feedback_status: str) -> str:
 
 
 def main() -> int:
-    scan = json.loads(open(os.environ["SCAN_JSON_PATH"], encoding="utf-8").read())
-    event = json.loads(open(os.environ["GITHUB_EVENT_PATH"], encoding="utf-8").read())
+    scan = loads(Path(os.environ["SCAN_JSON_PATH"]).read_bytes())
+    event = loads(Path(os.environ["GITHUB_EVENT_PATH"]).read_bytes())
 
     token = os.environ["GITHUB_TOKEN"]
     repo = os.environ["GITHUB_REPOSITORY"]
@@ -87,19 +77,14 @@ def main() -> int:
     pr_number = int(event["pull_request"]["number"])
 
     comments_url = f"{api}/repos/{repo}/issues/{pr_number}/comments"
-    comments = _request("GET", comments_url, token)
-
-    existing = None
-    for comment in comments:
-        if MARKER in str(comment.get("body", "")):
-            existing = comment
-            break
+    raw_comments = request_raw("GET", f"{comments_url}?per_page=100", token)
+    existing = find_marked_comment(raw_comments, MARKER_KEY)
 
     body = _build_comment(scan, pr_number, _feedback_status(existing))
     if existing:
-        _request("PATCH", f"{api}/repos/{repo}/issues/comments/{existing['id']}", token, {"body": body})
+        request("PATCH", f"{api}/repos/{repo}/issues/comments/{existing['id']}", token, {"body": body})
     else:
-        _request("POST", comments_url, token, {"body": body})
+        request("POST", comments_url, token, {"body": body})
 
     return 0
 
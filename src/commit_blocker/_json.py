@@ -0,0 +1,26 @@
+"""JSON codec shim that prefers orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+def loads(data: bytes | str) -> object:
+    """Decode a JSON document from UTF-8 bytes (or text)."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: object, *, indent: bool = False) -> bytes:
+    """Encode `obj` as UTF-8 JSON bytes, optionally with two-space indentation."""
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import argparse
-import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 
-from .eval import evaluate, load_eval_config, load_examples, regression_status
-from .report import to_json, to_table
+from . import _json
+from .report import render
 from .scorer import load_weights, risk_band, score
 from .signals import extract_signals
 
 DEFAULT_WEIGHTS_CONFIG = Path("config/default_weights.json")
 
 
+def _default_weights_file() -> str | None:
+    return str(DEFAULT_WEIGHTS_CONFIG) if DEFAULT_WEIGHTS_CONFIG.exists() else None
+
+
+@lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
+    """Build the (shared, read-only) argument parser."""
+
     parser = argparse.ArgumentParser(prog="commit-blocker")
     subcommands = parser.add_subparsers(dest="command", required=True)
 
@@ -34,7 +42,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     scan.add_argument(
         "--weights-file",
-        default=str(DEFAULT_WEIGHTS_CONFIG) if DEFAULT_WEIGHTS_CONFIG.exists() else None,
+        default=None,
         help="optional JSON file with {\"weights\": {signal: value}}",
     )
 
@@ -50,7 +58,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     evaluate_parser.add_argument(
         "--weights-file",
-        default=str(DEFAULT_WEIGHTS_CONFIG) if DEFAULT_WEIGHTS_CONFIG.exists() else None,
+        default=None,
         help="optional JSON file with {\"weights\": {signal: value}}",
     )
     evaluate_parser.add_argument(
@@ -64,21 +72,20 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> int:
     parser = build_parser()
     args = parser.parse_args()
+    if args.weights_file is None:
+        args.weights_file = _default_weights_file()
 
     if args.command == "scan":
         signals = extract_signals(args.repo_path, max_commits=args.max_commits)
         weights = load_weights(args.weights_file) if args.weights_file else load_weights(None)
         final_score = score(signals, weights=weights)
         band = risk_band(final_score)
-        output = (
-            to_json(args.repo_path, final_score, band, signals, weights)
-            if args.format == "json"
-            else to_table(args.repo_path, final_score, band, signals, weights)
-        )
-        print(output)
+        print(render(args.repo_path, final_score, band, signals, weights, fmt=args.format))
         return 0
 
     if args.command == "eval":
+        from .eval import evaluate, load_eval_config, load_examples, regression_status
+
         examples = load_examples(args.examples_file)
         config = load_eval_config(args.config)
         report = evaluate(
@@ -104,9 +111,16 @@ def main() -> int:
         }
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(payload, indent=2) + "\n")
-
-        print(json.dumps(payload, indent=2))
+        blob = _json.dumps(payload, indent=True) + b"\n"
+        output_path.write_bytes(blob)
+
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is not None:
+            sys.stdout.flush()
+            stdout_buffer.write(blob)
+            stdout_buffer.flush()
+        else:
+            sys.stdout.write(blob.decode("utf-8"))
         return 1 if (not regression["passed"] or not launch_gate_passed) else 0
 
     parser.error(f"Unknown command: {args.command}")
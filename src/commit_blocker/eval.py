@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import json
+import os
+from bisect import bisect_left
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from . import _json
 from .scorer import load_weights, score
-from .signals import extract_signals
+from .signals import Signal, extract_signals
 
 
 @dataclass(frozen=True)
@@ -27,20 +30,21 @@ def load_examples(examples_path: str | Path) -> list[LabeledExample]:
     """Load JSONL examples with `agent_generated` labels."""
 
     examples: list[LabeledExample] = []
-    for idx, line in enumerate(Path(examples_path).read_text().splitlines(), start=1):
-        if not line.strip():
-            continue
-        payload = json.loads(line)
-        examples.append(
-            LabeledExample(
-                example_id=str(payload.get("id", f"example-{idx}")),
-                subject_type=str(payload.get("subject_type", "repo")),
-                repo_path=str(payload["repo_path"]),
-                repo_type=str(payload.get("repo_type", "unknown")),
-                agent_generated=bool(payload["agent_generated"]),
-                max_commits=int(payload.get("max_commits", 60)),
+    with Path(examples_path).open("rb") as handle:
+        for idx, line in enumerate(handle, start=1):
+            if line.isspace():
+                continue
+            payload = _json.loads(line)
+            examples.append(
+                LabeledExample(
+                    example_id=str(payload.get("id", f"example-{idx}")),
+                    subject_type=str(payload.get("subject_type", "repo")),
+                    repo_path=str(payload["repo_path"]),
+                    repo_type=str(payload.get("repo_type", "unknown")),
+                    agent_generated=bool(payload["agent_generated"]),
+                    max_commits=int(payload.get("max_commits", 60)),
+                )
             )
-        )
     return examples
 
 
@@ -49,18 +53,23 @@ def _classification_counts(
     scores: list[float],
     threshold: float,
 ) -> dict[str, int]:
-    tp = fp = tn = fn = 0
-    for label, value in zip(labels, scores):
-        predicted = value >= threshold
-        if predicted and label:
-            tp += 1
-        elif predicted and not label:
-            fp += 1
-        elif not predicted and not label:
-            tn += 1
-        else:
-            fn += 1
-    return {"tp": tp, "fp": fp, "tn": tn, "fn": fn}
+    return _sweep_counts(labels, scores, [threshold])[0]
+
+
+def _sweep_counts(
+    labels: list[bool],
+    scores: list[float],
+    thresholds: list[float],
+) -> list[dict[str, int]]:
+    positives = sorted(value for label, value in zip(labels, scores) if label)
+    negatives = sorted(value for label, value in zip(labels, scores) if not label)
+
+    counts: list[dict[str, int]] = []
+    for threshold in thresholds:
+        fn = bisect_left(positives, threshold)
+        tn = bisect_left(negatives, threshold)
+        counts.append({"tp": len(positives) - fn, "fp": len(negatives) - tn, "tn": tn, "fn": fn})
+    return counts
 
 
 def _metrics_from_counts(counts: dict[str, int]) -> dict[str, float]:
@@ -84,22 +93,22 @@ def _metrics_from_counts(counts: dict[str, int]) -> dict[str, float]:
 def _fpr_by_repo_type(
     examples: list[LabeledExample],
     scores: list[float],
-    threshold: float,
-) -> dict[str, float]:
-    negatives_by_type: dict[str, int] = defaultdict(int)
-    fp_by_type: dict[str, int] = defaultdict(int)
-
+    thresholds: list[float],
+) -> list[dict[str, float]]:
+    negatives_by_type: dict[str, list[float]] = defaultdict(list)
     for example, value in zip(examples, scores):
-        if example.agent_generated:
-            continue
-        negatives_by_type[example.repo_type] += 1
-        if value >= threshold:
-            fp_by_type[example.repo_type] += 1
+        if not example.agent_generated:
+            negatives_by_type[example.repo_type].append(value)
+    for values in negatives_by_type.values():
+        values.sort()
 
-    return {
-        repo_type: (fp_by_type[repo_type] / count if count else 0.0)
-        for repo_type, count in negatives_by_type.items()
-    }
+    return [
+        {
+            repo_type: (len(values) - bisect_left(values, threshold)) / len(values)
+            for repo_type, values in negatives_by_type.items()
+        }
+        for threshold in thresholds
+    ]
 
 
 def evaluate(
@@ -114,9 +123,16 @@ def evaluate(
     labels = [item.agent_generated for item in examples]
     sample_scores: list[float] = []
     sample_results: list[dict[str, object]] = []
+    # Examples often share a repository (e.g. a PR and its commits), so extract each once.
+    # Extraction is dominated by git subprocesses and file reads, so run repos concurrently.
+    keys = list(dict.fromkeys((item.repo_path, item.max_commits) for item in examples))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as pool:
+        signal_cache: dict[tuple[str, int], list[Signal]] = dict(
+            zip(keys, pool.map(lambda key: extract_signals(key[0], max_commits=key[1]), keys))
+        )
 
     for item in examples:
-        signals = extract_signals(item.repo_path, max_commits=item.max_commits)
+        signals = signal_cache[(item.repo_path, item.max_commits)]
         value = score(signals, weights)
         sample_scores.append(value)
         sample_results.append(
@@ -135,15 +151,16 @@ def evaluate(
     metrics = _metrics_from_counts(counts)
 
     sweep: list[dict[str, object]] = []
-    for item in thresholds:
-        item_counts = _classification_counts(labels, sample_scores, item)
+    sweep_counts = _sweep_counts(labels, sample_scores, thresholds)
+    sweep_fpr = _fpr_by_repo_type(examples, sample_scores, thresholds)
+    for item, item_counts, item_fpr in zip(thresholds, sweep_counts, sweep_fpr):
         item_metrics = _metrics_from_counts(item_counts)
         sweep.append(
             {
                 "threshold": item,
                 "confusion_matrix": item_counts,
                 "metrics": item_metrics,
-                "false_positive_rate_by_repo_type": _fpr_by_repo_type(examples, sample_scores, item),
+                "false_positive_rate_by_repo_type": item_fpr,
             }
         )
 
@@ -152,7 +169,7 @@ def evaluate(
         "threshold": threshold,
         "confusion_matrix": counts,
         "metrics": metrics,
-        "false_positive_rate_by_repo_type": _fpr_by_repo_type(examples, sample_scores, threshold),
+        "false_positive_rate_by_repo_type": _fpr_by_repo_type(examples, sample_scores, [threshold])[0],
         "threshold_sweep": sweep,
         "samples": sample_results,
     }
@@ -161,7 +178,7 @@ def evaluate(
 def load_eval_config(path: str | Path) -> dict[str, object]:
     """Load evaluation config JSON for thresholds and regression budget."""
 
-    config = json.loads(Path(path).read_text())
+    config = _json.loads(Path(path).read_bytes())
     threshold = float(config.get("threshold", 0.5))
     sweep = [float(v) for v in config.get("threshold_sweep", [0.1, 0.3, 0.5, 0.7, 0.9])]
     regression = config.get("regression", {})
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
-import json
-from textwrap import shorten
+from operator import itemgetter
+from textwrap import TextWrapper
 
+from . import _json
 from .signals import Signal
 
+EVIDENCE_WIDTH = 58
+_EVIDENCE_WRAPPER = TextWrapper(width=EVIDENCE_WIDTH, max_lines=1, placeholder="…")
+
+
+def _short_evidence(text: str) -> str:
+    # Same result as textwrap.shorten, without building a TextWrapper per row.
+    text = " ".join(text.split())
+    return text if len(text) <= EVIDENCE_WIDTH else _EVIDENCE_WRAPPER.fill(text)
+
 
 def _contributions(signals: list[Signal], weights: dict[str, float]) -> list[dict[str, float | str]]:
-    rows = []
+    ranked = []
     for s in signals:
         w = weights.get(s.name, 0.0)
-        rows.append(
-            {
-                "name": s.name,
-                "signal_score": round(s.score, 3),
-                "weight": round(w, 3),
-                "contribution": round(s.score * w, 3),
-                "evidence": s.evidence,
-            }
-        )
-    return sorted(rows, key=lambda r: float(r["contribution"]), reverse=True)
+        ranked.append((s.score * w, w, s))
+    ranked.sort(key=itemgetter(0), reverse=True)
+    return [
+        {
+            "name": s.name,
+            "signal_score": s.score,
+            "weight": w,
+            "contribution": contribution,
+            "evidence": s.evidence,
+        }
+        for contribution, w, s in ranked
+    ]
 
 
 def to_json(
@@ -30,15 +42,26 @@ def to_json(
     band: str,
     signals: list[Signal],
     weights: dict[str, float],
+    rows: list[dict[str, float | str]] | None = None,
 ) -> str:
+    if rows is None:
+        rows = _contributions(signals, weights)
     payload = {
         "repo_path": repo_path,
         "score": round(final_score, 3),
         "score_100": round(final_score * 100, 1),
         "risk_band": band,
-        "signals": _contributions(signals, weights),
+        "signals": [
+            {
+                **r,
+                "signal_score": round(r["signal_score"], 3),
+                "weight": round(r["weight"], 3),
+                "contribution": round(r["contribution"], 3),
+            }
+            for r in rows
+        ],
     }
-    return json.dumps(payload, indent=2)
+    return _json.dumps(payload, indent=True).decode("utf-8")
 
 
 def to_table(
@@ -47,14 +70,31 @@ def to_table(
     band: str,
     signals: list[Signal],
     weights: dict[str, float],
+    rows: list[dict[str, float | str]] | None = None,
 ) -> str:
+    if rows is None:
+        rows = _contributions(signals, weights)
     header = (
         f"Commit Blocker scan: {repo_path}\n"
         f"Likely agent-generated score: {final_score:.3f} ({final_score*100:.1f}/100, {band})\n"
     )
     cols = "| Signal | Score | Weight | Contribution | Evidence |\n|---|---:|---:|---:|---|"
-    rows = "\n".join(
-        f"| {r['name']} | {r['signal_score']:.3f} | {r['weight']:.3f} | {r['contribution']:.3f} | {shorten(str(r['evidence']), width=58, placeholder='…')} |"
-        for r in _contributions(signals, weights)
+    body = "\n".join(
+        f"| {r['name']} | {r['signal_score']:.3f} | {r['weight']:.3f} | {r['contribution']:.3f} | {_short_evidence(str(r['evidence']))} |"
+        for r in rows
     )
-    return f"{header}\n{cols}\n{rows}" if rows else f"{header}\n{cols}"
+    return f"{header}\n{cols}\n{body}" if body else f"{header}\n{cols}"
+
+
+def render(
+    repo_path: str,
+    final_score: float,
+    band: str,
+    signals: list[Signal],
+    weights: dict[str, float],
+    fmt: str = "table",
+) -> str:
+    rows = _contributions(signals, weights)
+    if fmt == "json":
+        return to_json(repo_path, final_score, band, signals, weights, rows=rows)
+    return to_table(repo_path, final_score, band, signals, weights, rows=rows)
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
+from operator import mul
 from pathlib import Path
+from types import MappingProxyType
 
-from .signals import Signal
+from . import _json
+from .signals import Signal, _clamp
 
-DEFAULT_WEIGHTS = {
+# Read-only so scoring can use it directly; load_weights() hands out mutable copies.
+DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType({
     "repo_unreadable_or_not_git": 1.0,
     "message_agentic_phrases": 1.0,
     "message_templated_structure": 0.7,
@@ -15,17 +19,17 @@ DEFAULT_WEIGHTS = {
     "commit_burst_pattern": 0.7,
     "author_generic_identity": 0.8,
     "diff_todo_placeholders": 0.5,
-}
+})
 
 
 def load_weights(config_path: str | Path | None = None) -> dict[str, float]:
     """Load weights from a JSON config file."""
 
     if config_path is None:
-        return DEFAULT_WEIGHTS.copy()
+        return dict(DEFAULT_WEIGHTS)
 
     path = Path(config_path)
-    payload = json.loads(path.read_text())
+    payload = _json.loads(path.read_bytes())
     weights = payload.get("weights", {})
     return {str(k): float(v) for k, v in weights.items()}
 
@@ -34,18 +38,24 @@ def score(signals: list[Signal], weights: dict[str, float] | None = None) -> flo
     """Return weighted aggregate score in the [0.0, 1.0] range."""
 
     active_weights = weights or DEFAULT_WEIGHTS
-    total_weight = 0.0
-    weighted_sum = 0.0
-
+    # Only signals with a nonzero weight contribute to either sum.
+    signal_scores: list[float] = []
+    signal_weights: list[float] = []
     for signal in signals:
-        weight = active_weights.get(signal.name, 0.0)
-        weighted_sum += signal.score * weight
-        total_weight += weight
+        weight = active_weights.get(signal.name)
+        if weight:
+            signal_scores.append(signal.score)
+            signal_weights.append(weight)
+
+    if not signal_weights:
+        return 0.0
 
+    total_weight = sum(signal_weights)
     if total_weight == 0.0:
         return 0.0
 
-    return max(0.0, min(1.0, weighted_sum / total_weight))
+    weighted_sum = sum(map(mul, signal_scores, signal_weights))
+    return _clamp(weighted_sum / total_weight)
 
 
 def risk_band(final_score: float) -> str:
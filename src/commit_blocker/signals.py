@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+import os
 import re
 import subprocess
 from datetime import datetime
@@ -20,6 +22,7 @@ AGENTIC_PATTERNS = [
 TEMPLATED_SECTION_RE = re.compile(r"(?im)^\s*(summary|testing|notes)\s*[:\-]")
 GENERIC_AUTHOR_RE = re.compile(r"(?i)(bot|ai|automation|noreply)")
 TODO_TOKEN_RE = re.compile(r"(?i)\b(todo|fixme|tbd|fill this in)\b")
+SKIP_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".pdf", ".zip", ".lock"})
 
 
 @dataclass(slots=True)
@@ -46,42 +49,56 @@ def _git_available(repo: Path) -> bool:
 
 
 def _clamp(value: float) -> float:
-    return max(0.0, min(1.0, value))
+    return 0.0 if value <= 0.0 else (value if value <= 1.0 else 1.0)
 
 
-def _extract_commit_messages(repo: Path, max_commits: int) -> list[str]:
-    raw = _run_git(repo, "log", f"-n{max_commits}", "--pretty=format:%B%x1e")
-    return [c.strip() for c in raw.split("\x1e") if c.strip()]
+def _extract_commits(repo: Path, max_commits: int) -> tuple[list[str], list[datetime], list[str]]:
+    """Return (messages, timestamps, authors) from a single `git log` walk."""
 
-
-def _extract_commit_timestamps(repo: Path, max_commits: int) -> list[datetime]:
-    raw = _run_git(repo, "log", f"-n{max_commits}", "--pretty=format:%aI")
+    raw = _run_git(repo, "log", f"-n{max_commits}", "--pretty=format:%aI%x1f%ae%x1f%B%x1e")
+    messages: list[str] = []
     timestamps: list[datetime] = []
-    for line in raw.splitlines():
-        text = line.strip()
-        if not text:
-            continue
-        timestamps.append(datetime.fromisoformat(text))
-    return timestamps
-
-
-def _extract_authors(repo: Path, max_commits: int) -> list[str]:
-    raw = _run_git(repo, "log", f"-n{max_commits}", "--pretty=format:%ae")
-    return [line.strip() for line in raw.splitlines() if line.strip()]
-
-
-def _read_text_files(repo: Path) -> list[str]:
-    text_blobs: list[str] = []
-    for file_path in repo.rglob("*"):
-        if not file_path.is_file() or ".git" in file_path.parts:
-            continue
-        if file_path.suffix.lower() in {".png", ".jpg", ".jpeg", ".gif", ".pdf", ".zip", ".lock"}:
+    authors: list[str] = []
+    for record in raw.split("\x1e"):
+        if not record.strip():
             continue
+        stamp, author, body = record.lstrip("\n").split("\x1f", 2)
+        timestamps.append(datetime.fromisoformat(stamp.strip()))
+        if author.strip():
+            authors.append(author.strip())
+        if body.strip():
+            messages.append(body.strip())
+    return messages, timestamps, authors
+
+
+def _iter_text_files(repo: Path) -> Iterator[str]:
+    pending = [str(repo)]
+    while pending:
         try:
-            text_blobs.append(file_path.read_text(encoding="utf-8", errors="ignore"))
+            entries = os.scandir(pending.pop())
         except OSError:
             continue
-    return text_blobs
+        with entries:
+            for entry in entries:
+                # Prune .git (directory, or worktree/submodule pointer file) without descending.
+                if entry.name == ".git":
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in SKIP_SUFFIXES:
+                    continue
+                try:
+                    with open(entry.path, encoding="utf-8", errors="ignore") as handle:
+                        text = handle.read()
+                except OSError:
+                    continue
+                yield text
 
 
 def extract_signals(repo_path: str | Path, max_commits: int = 60) -> list[Signal]:
@@ -97,9 +114,7 @@ def extract_signals(repo_path: str | Path, max_commits: int = 60) -> list[Signal
             )
         ]
 
-    messages = _extract_commit_messages(repo, max_commits=max_commits)
-    timestamps = _extract_commit_timestamps(repo, max_commits=max_commits)
-    authors = _extract_authors(repo, max_commits=max_commits)
+    messages, timestamps, authors = _extract_commits(repo, max_commits=max_commits)
 
     agentic_matches = sum(
         1 for msg in messages if any(pattern.search(msg) for pattern in AGENTIC_PATTERNS)
@@ -127,9 +142,12 @@ def extract_signals(repo_path: str | Path, max_commits: int = 60) -> list[Signal
     generic_authors = sum(1 for author in authors if GENERIC_AUTHOR_RE.search(author))
     generic_author_score = _clamp(generic_authors / max(1, len(authors)))
 
-    text_blobs = _read_text_files(repo)
-    todo_hits = sum(len(TODO_TOKEN_RE.findall(blob)) for blob in text_blobs)
-    todo_density = todo_hits / max(1, len(text_blobs))
+    # Count while walking so only one file's text is held in memory at a time.
+    todo_hits = files_scanned = 0
+    for blob in _iter_text_files(repo):
+        todo_hits += len(TODO_TOKEN_RE.findall(blob))
+        files_scanned += 1
+    todo_density = todo_hits / max(1, files_scanned)
     todo_score = _clamp(todo_density / 4.0)
 
     return [
@@ -138,5 +156,5 @@ def extract_signals(repo_path: str | Path, max_commits: int = 60) -> list[Signal
         Signal("commit_unusual_hours", unusual_hours_score, f"unusual_hours={unusual_commits}/{len(timestamps)}"),
         Signal("commit_burst_pattern", burst_score, f"max_20min_burst_ratio={burst_ratio:.2f}"),
         Signal("author_generic_identity", generic_author_score, f"generic_authors={generic_authors}/{len(authors)}"),
-        Signal("diff_todo_placeholders", todo_score, f"todo_hits={todo_hits};files_scanned={len(text_blobs)}"),
+        Signal("diff_todo_placeholders", todo_score, f"todo_hits={todo_hits};files_scanned={files_scanned}"),
     ]